@@ -0,0 +1,126 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+from django.template import loader
+
+from .templatetags.bootstrap import bootstrap_field, bootstrap_form, pager, readonly_context, value_context
+
+import asyncio
+import concurrent.futures
+import contextvars
+import functools
+import threading
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """
+    Returns the (bounded) thread pool used for rendering. The number of threads is controlled by the
+    ``BOOTSTRAP_RENDER_THREADS`` setting, which defaults to 4.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=getattr(settings, 'BOOTSTRAP_RENDER_THREADS', 4),
+                thread_name_prefix='bootstrap-render',
+            )
+        return _executor
+
+
+def _call(func, *args, **kwargs):
+    try:
+        return func(*args, **kwargs)
+    finally:
+        # Querysets are evaluated before rendering, but custom widgets or templates may still have opened a
+        # connection in this thread.
+        close_old_connections()
+
+
+def prepare_fields(fields):
+    """
+    Evaluates everything about the given bound fields that may query the database when rendered: form
+    validation, and widget choices (``ModelChoiceField`` querysets, or cached choices). Called using
+    ``sync_to_async`` before a form or field is rendered on the render thread pool.
+    """
+    for field in fields:
+        field.errors
+        widget = field.field.widget
+        if hasattr(widget, 'choices'):
+            widget.choices = list(widget.choices)
+
+
+async def run_in_pool(func, *args, **kwargs):
+    """
+    Runs ``func(*args, **kwargs)`` on the render thread pool, preserving the current context (active
+    language, etc.), and returns the result.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = functools.partial(_call, func, *args, **kwargs)
+    return await loop.run_in_executor(get_executor(), context.run, call)
+
+
+async def abootstrap_form(form, template=None, **kwargs):
+    """
+    Async version of the ``bootstrap_form`` templatetag. The form is validated and any querysets are evaluated
+    using ``sync_to_async`` (see :func:`prepare_fields`), and the form is rendered on the render thread pool.
+    """
+    await sync_to_async(prepare_fields)(form)
+    return await run_in_pool(bootstrap_form, form, template=template, **kwargs)
+
+
+async def abootstrap_forms(forms, template=None, **kwargs):
+    """
+    Renders each form in ``forms`` concurrently using ``bootstrap_form``, and returns a list of the
+    rendered forms in the same order.
+    """
+    return await asyncio.gather(*[abootstrap_form(form, template=template, **kwargs) for form in forms])
+
+
+async def abootstrap_field(field, classes='', template=None, **kwargs):
+    """ Async version of the ``bootstrap_field`` templatetag, with querysets evaluated like ``abootstrap_form``. """
+    if field:
+        await sync_to_async(prepare_fields)([field])
+    return await run_in_pool(bootstrap_field, field, classes=classes, template=template, **kwargs)
+
+
+async def arender_readonly(field, template=None, **kwargs):
+    """
+    Async version of the ``render_readonly`` templatetag. The field's value is converted using
+    ``sync_to_async``, and the template is rendered on the render thread pool.
+    """
+    context = await sync_to_async(readonly_context)(field, template=template, **kwargs)
+    if context is None:
+        return ''
+    templates, params = context
+    return await run_in_pool(loader.render_to_string, templates, params)
+
+
+async def apager(total, page_size=10, page=1, param='page', querystring='', spread=7, template=None):
+    """ Async version of the ``pager`` templatetag. """
+    return await run_in_pool(pager, total, page_size=page_size, page=page, param=param,
+                             querystring=querystring, spread=spread, template=template)
+
+
+async def arender_value(obj, field_name, template=None, classes='', label=None, default='', **kwargs):
+    """
+    Async version of the ``render_value`` templatetag. The ContentType lookup and any related managers
+    are evaluated using ``sync_to_async``, and the template is rendered on the render thread pool.
+    """
+    templates, params = await sync_to_async(value_context)(
+        obj, field_name, template=template, classes=classes, label=label, default=default, **kwargs)
+    return await run_in_pool(loader.render_to_string, templates, params)
+
+
+async def arender_values(obj, field_names, template=None, classes='', default='', **kwargs):
+    """
+    Renders each of ``field_names`` on ``obj`` concurrently using ``render_value``, and returns a list of
+    the rendered values in the same order.
+    """
+    return await asyncio.gather(*[
+        arender_value(obj, name, template=template, classes=classes, default=default, **kwargs)
+        for name in field_names
+    ])
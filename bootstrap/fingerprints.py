@@ -0,0 +1,136 @@
+from django.db import models
+from django.template import TemplateDoesNotExist, loader
+from django.utils.encoding import force_text
+from django.utils.translation import get_language
+from django.views.decorators.http import etag
+
+from . import __version__
+from .templatetags.bootstrap import field_templates, form_templates, pager_templates, value_context
+
+import hashlib
+import json
+import os
+
+
+def _normalize(value):
+    if isinstance(value, models.Model):
+        return [value._meta.label_lower, value.pk, force_text(value)]
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        return [_normalize(v) for v in value]
+    elif isinstance(value, dict):
+        return {force_text(k): _normalize(v) for k, v in value.items()}
+    elif value is None or isinstance(value, (bool, int, float)):
+        return value
+    return force_text(value)
+
+
+def fingerprint(*parts):
+    """
+    Returns a stable hex digest of ``parts``, which may be any combination of strings, numbers, lists,
+    dicts, and model instances (or other fingerprints).
+    """
+    data = json.dumps(_normalize(parts), sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+
+def template_version(templates):
+    """
+    Returns the name and modification time of the template that would be chosen from ``templates``,
+    without rendering it.
+    """
+    try:
+        name = loader.select_template(templates).origin.name
+    except TemplateDoesNotExist:
+        return None
+    try:
+        mtime = os.path.getmtime(name)
+    except (OSError, TypeError, ValueError):
+        mtime = None
+    return [name, mtime]
+
+
+def form_fingerprint(form, template=None, **kwargs):
+    """
+    Returns a fingerprint of what ``bootstrap_form`` would render for ``form``, based on the form class,
+    each field's value (bound data or initial data), any errors, the active language, and the templates
+    chosen for the form and its fields. Choices coming from querysets are not included; pass something
+    like a last-modified timestamp in ``kwargs`` if they matter.
+    """
+    parts = [
+        'form',
+        __version__,
+        get_language(),
+        '%s.%s' % (form.__class__.__module__, form.__class__.__qualname__),
+        form.prefix,
+        template_version(form_templates(form, template)),
+        kwargs,
+        form.errors.get_json_data() if form.is_bound else None,
+    ]
+    for field in form:
+        parts.append([
+            field.html_name,
+            field.value(),
+            None if field.is_hidden else template_version(field_templates(field)),
+        ])
+    return fingerprint(*parts)
+
+
+def value_fingerprint(obj, field_name, template=None, classes='', label=None, default='', **kwargs):
+    """
+    Returns a fingerprint of what ``render_value`` would render for ``field_name`` on ``obj``.
+    """
+    templates, params = value_context(obj, field_name, template, classes, label, default, **kwargs)
+    return fingerprint('value', __version__, get_language(), template_version(templates), params)
+
+
+def pager_fingerprint(total, page_size=10, page=1, param='page', querystring='', spread=7, template=None):
+    """
+    Returns a fingerprint of what ``pager`` would render for the given arguments.
+    """
+    return fingerprint('pager', __version__, get_language(), template_version(pager_templates(template)),
+                       total, page_size, page, param, querystring, spread)
+
+
+def request_fingerprint(request):
+    """
+    Returns a fingerprint of the request-specific state a page usually depends on: the user, the CSRF token, and
+    the active language. Returns ``None`` if there are pending messages, since those are only shown once.
+    """
+    storage = getattr(request, '_messages', None)
+    if storage is not None and len(storage):
+        return None
+    user = getattr(request, 'user', None)
+    return fingerprint('request', getattr(user, 'pk', None), request.META.get('CSRF_COOKIE'), get_language())
+
+
+def render_etag(fingerprint_func, include_request=True):
+    """
+    View decorator that uses the fingerprint(s) returned by ``fingerprint_func(request, *args, **kwargs)``
+    as the response's ETag, returning a 304 for a matching ``If-None-Match`` without calling the view::
+
+        def detail_fingerprint(request, pk):
+            req = Request.objects.get(pk=pk)
+            return [form_fingerprint(RequestForm(instance=req)), value_fingerprint(req, 'status')]
+
+        @render_etag(detail_fingerprint)
+        def request_detail(request, pk):
+            ...
+
+    By default, :func:`request_fingerprint` is mixed in, so a page is never reused for a different user or
+    CSRF token, or when there are messages to show. If ``include_request`` is ``False``, ``fingerprint_func``
+    must account for any request-specific state the page renders. If either fingerprint is ``None``, no ETag
+    is used.
+    """
+    def etag_func(request, *args, **kwargs):
+        value = fingerprint_func(request, *args, **kwargs)
+        if value is None:
+            return None
+        if not isinstance(value, str):
+            value = fingerprint(*value)
+        if include_request:
+            request_value = request_fingerprint(request)
+            if request_value is None:
+                return None
+            value = fingerprint(value, request_value)
+        return value
+    return etag(etag_func)
@@ -0,0 +1,149 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.template import engines
+from django.template.utils import get_app_template_dirs
+
+from bootstrap.templatetags.bootstrap import FONT_AWESOME_FILE_TYPE_ICON_MAP, FONT_AWESOME_MIME_TYPE_ICON_MAP
+
+import hashlib
+import json
+import os
+import re
+
+FONTAWESOME_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'static', 'fontawesome')
+FONT_FILENAME = 'fontawesome-webfont.woff2'
+
+ICON_RE = re.compile(r'\bfa-[a-z0-9]+(?:-[a-z0-9]+)*')
+COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+KEYFRAMES_RE = re.compile(r'@(?:-webkit-)?keyframes[^{]*\{(?:[^{}]*\{[^{}]*\})*\s*\}')
+RULE_RE = re.compile(r'([^{}]+)\{([^{}]*)\}')
+ICON_SELECTOR_RE = re.compile(r'^\.(fa-[a-z0-9-]+):before$')
+CONTENT_RE = re.compile(r'content:\s*"\\([0-9a-f]+)"')
+
+
+def template_dirs():
+    dirs = set(get_app_template_dirs('templates'))
+    for engine in engines.all():
+        dirs.update(getattr(engine, 'template_dirs', []))
+    return sorted(str(d) for d in dirs)
+
+
+def find_icons(dirs):
+    icons = set()
+    for root_dir in dirs:
+        for root, _dirs, files in os.walk(root_dir):
+            for name in files:
+                try:
+                    with open(os.path.join(root, name), encoding='utf-8') as f:
+                        icons.update(ICON_RE.findall(f.read()))
+                except (OSError, UnicodeDecodeError):
+                    continue
+    return icons
+
+
+def parse_css(css):
+    """
+    Splits the Font Awesome CSS into base rules (everything that isn't an icon), keyframes blocks, and icon
+    rules, returned as ``(selectors, codepoint)`` tuples.
+    """
+    base, icon_rules = [], []
+    css = COMMENT_RE.sub('', css)
+    keyframes = KEYFRAMES_RE.findall(css)
+    for selector_text, body in RULE_RE.findall(KEYFRAMES_RE.sub('', css)):
+        selectors = [s.strip() for s in selector_text.split(',')]
+        content = CONTENT_RE.search(body)
+        matches = [ICON_SELECTOR_RE.match(s) for s in selectors]
+        if content and all(matches):
+            icon_rules.append(([m.group(1) for m in matches], int(content.group(1), 16)))
+        elif not selectors[0].startswith('@font-face'):
+            base.append((selectors, body.strip()))
+    return base, keyframes, icon_rules
+
+
+def format_rule(selectors, declarations, minify=False):
+    if minify:
+        declarations = ';'.join(d.strip() for d in declarations.split(';') if d.strip())
+        return '%s{%s}' % (','.join(selectors), declarations)
+    lines = ['  %s;' % d.strip() for d in declarations.split(';') if d.strip()]
+    return '%s {\n%s\n}' % (',\n'.join(selectors), '\n'.join(lines))
+
+
+class Command (BaseCommand):
+    help = ('Builds a subset of the bundled Font Awesome font and CSS containing only the icons used in '
+            'templates and the file type icon maps. Requires fonttools and brotli.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('output_dir', help='Directory to write css/, fonts/, and manifest.json to. To '
+                            'override the bundled files, use a "fontawesome" directory in STATICFILES_DIRS.')
+        parser.add_argument('--icon', action='append', default=[], dest='icons',
+                            help='An additional icon (e.g. fa-trash) to include. May be specified multiple times.')
+        parser.add_argument('--template-dir', action='append', default=[], dest='template_dirs',
+                            help='An additional directory to scan for icons. May be specified multiple times.')
+
+    def handle(self, *args, **options):
+        try:
+            from fontTools import subset
+        except ImportError:
+            raise CommandError('The fonttools package (and brotli, for WOFF2 output) is required to subset fonts.')
+
+        with open(os.path.join(FONTAWESOME_DIR, 'css', 'font-awesome.css'), encoding='utf-8') as f:
+            css = f.read()
+        banner = COMMENT_RE.match(css)
+        base, keyframes, icon_rules = parse_css(css)
+
+        used = find_icons(template_dirs() + options['template_dirs'])
+        used.update(FONT_AWESOME_FILE_TYPE_ICON_MAP.values())
+        used.update(FONT_AWESOME_MIME_TYPE_ICON_MAP.values())
+        used.add('fa-file-o')
+        used.update(icon if icon.startswith('fa-') else 'fa-' + icon for icon in options['icons'])
+
+        codepoints = {}
+        rules = []
+        for selectors, codepoint in icon_rules:
+            selected = [s for s in selectors if s in used]
+            if selected:
+                rules.append((['.%s:before' % s for s in selected], 'content: "\\%x"' % codepoint))
+                codepoints.update((s, codepoint) for s in selected)
+        if not codepoints:
+            raise CommandError('No Font Awesome icons were found.')
+
+        output_dir = options['output_dir']
+        os.makedirs(os.path.join(output_dir, 'css'), exist_ok=True)
+        os.makedirs(os.path.join(output_dir, 'fonts'), exist_ok=True)
+
+        subset_options = subset.Options()
+        subset_options.flavor = 'woff2'
+        font = subset.load_font(os.path.join(FONTAWESOME_DIR, 'fonts', 'fontawesome-webfont.ttf'), subset_options)
+        subsetter = subset.Subsetter(subset_options)
+        subsetter.populate(unicodes=set(codepoints.values()))
+        subsetter.subset(font)
+        font_path = os.path.join(output_dir, 'fonts', FONT_FILENAME)
+        subset.save_font(font, font_path, subset_options)
+        with open(font_path, 'rb') as f:
+            font_hash = hashlib.md5(f.read()).hexdigest()[:12]
+
+        font_face = (['@font-face'], "font-family: 'FontAwesome'; src: url('../fonts/%s?v=%s') format('woff2'); "
+                     "font-weight: normal; font-style: normal" % (FONT_FILENAME, font_hash))
+        all_rules = [font_face] + base + rules
+        files = {}
+        for filename, minify in (('font-awesome.css', False), ('font-awesome.min.css', True)):
+            blocks = [format_rule(s, d, minify=minify) for s, d in all_rules]
+            blocks.extend(re.sub(r'\s+', ' ', k) if minify else k for k in keyframes)
+            content = ('' if minify else '\n').join(blocks)
+            if banner:
+                content = banner.group(0) + '\n' + content
+            with open(os.path.join(output_dir, 'css', filename), 'w', encoding='utf-8') as f:
+                f.write(content + '\n')
+            files['css/' + filename] = os.path.getsize(os.path.join(output_dir, 'css', filename))
+        files['fonts/' + FONT_FILENAME] = os.path.getsize(font_path)
+
+        manifest = {
+            'icons': {name: '%x' % codepoint for name, codepoint in sorted(codepoints.items())},
+            'files': files,
+            'font_hash': font_hash,
+        }
+        with open(os.path.join(output_dir, 'manifest.json'), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+
+        original = os.path.getsize(os.path.join(FONTAWESOME_DIR, 'fonts', FONT_FILENAME))
+        self.stdout.write('Wrote %d icons to %s (%s: %d bytes, originally %d bytes)' % (
+            len(codepoints), output_dir, FONT_FILENAME, files['fonts/' + FONT_FILENAME], original))
@@ -0,0 +1,225 @@
+from django import forms
+from django.conf import settings
+from django.core.cache import caches
+from django.forms.renderers import get_default_renderer
+from django.forms.widgets import Input
+from django.http import JsonResponse
+from django.template import TemplateDoesNotExist
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.encoding import force_text
+from django.utils.translation import get_language
+
+from . import __version__
+from .fingerprints import fingerprint
+from .templatetags.bootstrap import FieldView, add_tokens
+
+import os
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+
+
+def _widget_kind(widget):
+    # Widgets rendered as more than a single element with a single value (multi-widgets, file inputs, template
+    # widgets) are "html": the client can't render them, so form_state sends them pre-rendered.
+    if isinstance(widget, (forms.MultipleHiddenInput, forms.FileInput)):
+        return 'html'
+    elif isinstance(widget, forms.CheckboxInput):
+        return 'checkbox'
+    elif isinstance(widget, (forms.RadioSelect, forms.CheckboxSelectMultiple)):
+        return 'choices'
+    elif isinstance(widget, forms.Select):
+        return 'select'
+    elif isinstance(widget, forms.Textarea):
+        return 'textarea'
+    elif isinstance(widget, Input):
+        return 'input'
+    return 'html'
+
+
+def _uses_attrs_override():
+    # Whether the form renderer picks up this package's django/forms/widgets/attrs.html, which adds
+    # form-control classes (only the case with the TemplatesSetting renderer, typically).
+    try:
+        origin = get_default_renderer().get_template('django/forms/widgets/attrs.html').origin.name
+    except (AttributeError, TemplateDoesNotExist):
+        return False
+    return os.path.abspath(origin).startswith(TEMPLATES_DIR)
+
+
+def _clean_attrs(attrs):
+    return {k: v if isinstance(v, bool) else force_text(v) for k, v in attrs.items()
+            if k not in ('checked', 'selected')}
+
+
+def _field_view(field):
+    widget = field.field.widget
+    return FieldView(field, field.field.__class__.__name__.lower(), widget.__class__.__name__.lower(),
+                     isinstance(widget, forms.CheckboxInput), ' '.join(getattr(field.field, 'css_classes', [])),
+                     getattr(widget, 'use_fieldset', False))
+
+
+def field_schema(field):
+    """
+    Returns the render plan for a (typically unbound) ``BoundField``: everything ``bootstrap/field.html``
+    needs that doesn't depend on the submitted data or errors. Fields with widgets the client can't render
+    are marked with ``client_renderable: false``, and rendered by ``form_state`` instead.
+    """
+    widget = field.field.widget
+    view = _field_view(field)
+    # Same attrs BoundField.as_widget would pass, on top of the ones bootstrap_field renders with (hidden
+    # fields are rendered directly by bootstrap/form.html).
+    attrs = dict(widget.attrs) if field.is_hidden else dict(view.attrs)
+    attrs.update(field.build_widget_attrs({}, widget))
+    if field.auto_id and 'id' not in widget.attrs:
+        attrs.setdefault('id', field.auto_id)
+    kind = _widget_kind(widget)
+    # The class the widget renders with when there are errors, since widgets may add their own classes after it.
+    invalid_attrs = dict(attrs, **{'class': add_tokens(attrs.get('class'), 'is-invalid')})
+    schema = {
+        'name': field.name,
+        'html_name': field.html_name,
+        'auto_id': view.auto_id,
+        'group_id': view.group_id,
+        'label_id': view.label_id,
+        'help_id': view.help_id,
+        'errors_id': view.errors_id,
+        'label': force_text(view.label),
+        'help_text': force_text(view.help_text),
+        'required': view.required,
+        'hidden': field.is_hidden,
+        'is_checkbox': isinstance(widget, forms.CheckboxInput),
+        'use_fieldset': getattr(widget, 'use_fieldset', False),
+        'show_label': getattr(widget, 'show_label', True),
+        'field_class': field.field.__class__.__name__.lower(),
+        'widget_class': widget.__class__.__name__.lower(),
+        'group_classes': view.group_classes,
+        'client_renderable': kind != 'html',
+        'widget': {
+            'kind': kind,
+            'type': getattr(widget, 'input_type', None) or '',
+            'multiple': getattr(widget, 'allow_multiple_selected', False),
+            'form_control': _uses_attrs_override(),
+        },
+    }
+    if kind != 'html':
+        context = widget.get_context(field.html_name, None, attrs)['widget']
+        schema['widget']['attrs'] = _clean_attrs(context['attrs'])
+        schema['widget']['invalid_class'] = force_text(widget.build_attrs(widget.attrs, invalid_attrs).get('class', ''))
+    if kind in ('select', 'choices'):
+        schema['widget']['options'] = [
+            {'value': force_text(option['value']), 'label': force_text(option['label']),
+             'attrs': _clean_attrs(option['attrs'])}
+            for _group, options, _index in context['optgroups'] for option in options
+        ]
+    if kind == 'choices':
+        # What bootstrap/field.html uses for each option's label, which (depending on the Django version) isn't
+        # necessarily the option's id.
+        for option, subwidget in zip(schema['widget']['options'], view.subwidgets()):
+            option['id_for_label'] = subwidget.id_for_label
+    return schema
+
+
+def build_form_schema(form_class, prefix=None):
+    """
+    Builds the render plan for ``form_class`` (which must be constructible without arguments), in the
+    order ``bootstrap/form.html`` renders fields. Custom form and field templates are not taken into account.
+    """
+    form = form_class(prefix=prefix)
+    return {
+        'form': '%s.%s' % (form_class.__module__, form_class.__qualname__),
+        'prefix': prefix,
+        'language': get_language(),
+        'fields': [field_schema(field) for field in form],
+    }
+
+
+def form_definition(form_class):
+    """
+    Returns a fingerprint of the field definitions of ``form_class`` (field and widget classes, labels, help
+    text, widget attrs, static choices, etc.), used to invalidate cached schemas when a form changes.
+    """
+    parts = []
+    for name, field in form_class.base_fields.items():
+        widget = field.widget
+        choices = getattr(widget, 'choices', None)
+        parts.append([
+            name,
+            '%s.%s' % (field.__class__.__module__, field.__class__.__qualname__),
+            '%s.%s' % (widget.__class__.__module__, widget.__class__.__qualname__),
+            field.label,
+            field.help_text,
+            field.required,
+            field.disabled,
+            None if callable(field.initial) else field.initial,
+            widget.attrs,
+            choices if isinstance(choices, (list, tuple)) else None,
+            getattr(field, 'css_classes', None),
+        ])
+    return fingerprint(*parts)
+
+
+def form_schema(form_class, prefix=None):
+    """
+    Returns the (cached) render plan for ``form_class`` in the active language. The cache alias and timeout
+    are controlled by the ``BOOTSTRAP_SCHEMA_CACHE`` (default ``"default"``) and ``BOOTSTRAP_SCHEMA_TIMEOUT``
+    (default one day) settings. Cached schemas are keyed on the form's field definitions (see
+    :func:`form_definition`) and the ``BOOTSTRAP_SCHEMA_VERSION`` setting, which should be changed when a
+    deploy changes anything else a schema depends on (fields added in ``__init__``, for instance). Note that
+    choices from querysets are cached along with the rest of the schema.
+    """
+    cache = caches[getattr(settings, 'BOOTSTRAP_SCHEMA_CACHE', 'default')]
+    key = 'bootstrap:schema:%s:%s:%s.%s:%s:%s:%s' % (
+        __version__, getattr(settings, 'BOOTSTRAP_SCHEMA_VERSION', ''), form_class.__module__,
+        form_class.__qualname__, prefix, get_language(), form_definition(form_class))
+    schema = cache.get(key)
+    if schema is None:
+        schema = build_form_schema(form_class, prefix=prefix)
+        cache.set(key, schema, getattr(settings, 'BOOTSTRAP_SCHEMA_TIMEOUT', 86400))
+    return schema
+
+
+def form_state(form):
+    """
+    Returns the per-request part of a form render: the formatted value of each field, any errors, and the
+    rendered widgets of fields that aren't ``client_renderable``. This is meant to be sent along with (but
+    separately from) the cached ``form_schema``.
+    """
+    values = {}
+    errors = {}
+    html = {}
+    for field in form:
+        widget = field.field.widget
+        kind = _widget_kind(widget)
+        value = field.value()
+        if kind == 'html':
+            values[field.name] = None
+            html[field.name] = force_text(field if field.is_hidden else _field_view(field).widget())
+        elif kind == 'checkbox':
+            values[field.name] = bool(widget.check_test(value))
+        elif getattr(widget, 'render_value', True) is False:
+            values[field.name] = None
+        else:
+            values[field.name] = widget.format_value(value)
+        if field.errors:
+            errors[field.name] = [force_text(e) for e in field.errors]
+    return {
+        'values': values,
+        'errors': errors,
+        'html': html,
+        'non_field_errors': [force_text(e) for e in form.non_field_errors()],
+    }
+
+
+def form_schema_response(form_class, prefix=None, max_age=None):
+    """
+    Returns a ``JsonResponse`` containing the ``form_schema`` for ``form_class``, with an ETag and a long
+    cache lifetime (``BOOTSTRAP_SCHEMA_TIMEOUT`` unless ``max_age`` is given).
+    """
+    schema = form_schema(form_class, prefix=prefix)
+    response = JsonResponse(schema)
+    response['ETag'] = '"%s"' % fingerprint(schema)
+    if max_age is None:
+        max_age = getattr(settings, 'BOOTSTRAP_SCHEMA_TIMEOUT', 86400)
+    patch_cache_control(response, public=True, max_age=max_age)
+    patch_vary_headers(response, ('Accept-Language',))
+    return response
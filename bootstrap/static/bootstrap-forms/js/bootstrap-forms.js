@@ -0,0 +1,180 @@
+/*
+ * Client-side renderer for form schemas exported by bootstrap.schema. Produces the same markup as the
+ * bootstrap/form.html and bootstrap/field.html templates, given a (cacheable) schema from form_schema and a
+ * per-request state from form_state:
+ *
+ *     element.innerHTML = BootstrapForms.renderForm(schema, state);
+ */
+(function (root) {
+    'use strict';
+
+    function escape(value) {
+        return String(value)
+            .replace(/&/g, '&amp;')
+            .replace(/</g, '&lt;')
+            .replace(/>/g, '&gt;')
+            .replace(/"/g, '&quot;')
+            .replace(/'/g, '&#x27;');
+    }
+
+    function extend(target, source) {
+        var result = {}, key;
+        for (key in target) {
+            if (target.hasOwnProperty(key)) result[key] = target[key];
+        }
+        for (key in source) {
+            if (source.hasOwnProperty(key)) result[key] = source[key];
+        }
+        return result;
+    }
+
+    function addTokens(value, tokens) {
+        var existing = (value || '').split(/\s+/).filter(Boolean);
+        tokens.forEach(function (token) {
+            if (existing.indexOf(token) === -1) existing.push(token);
+        });
+        return existing.join(' ');
+    }
+
+    // Mirrors the django/forms/widgets/attrs.html override in this package, when the server uses it.
+    function renderAttrs(attrs, type, formControl) {
+        var addFormControl = formControl && type !== 'checkbox' && type !== 'radio';
+        var html = '';
+        if (!attrs.hasOwnProperty('class') && addFormControl) {
+            html += ' class="form-control"';
+        }
+        Object.keys(attrs).forEach(function (name) {
+            var value = attrs[name];
+            if (value === false) return;
+            html += ' ' + name;
+            if (value !== true) {
+                html += '="' + escape(value);
+                if (name === 'class' && String(value).indexOf('form-control') === -1 && addFormControl) {
+                    html += ' form-control';
+                }
+                html += '"';
+            }
+        });
+        return html;
+    }
+
+    function isSelected(values, value) {
+        return (values || []).indexOf(value) !== -1;
+    }
+
+    function renderWidget(field, value, attrs) {
+        var widget = field.widget;
+        switch (widget.kind) {
+            case 'checkbox':
+                return '<input type="checkbox" name="' + escape(field.html_name) + '"' +
+                    renderAttrs(value ? extend(attrs, {checked: true}) : attrs, 'checkbox', widget.form_control) + '>';
+            case 'textarea':
+                return '<textarea name="' + escape(field.html_name) + '"' + renderAttrs(attrs, '', widget.form_control) + '>\n' +
+                    (value ? escape(value) : '') + '</textarea>';
+            case 'select':
+                var options = widget.options.map(function (option) {
+                    var optionAttrs = isSelected(value, option.value) ? extend(option.attrs, {selected: true}) : option.attrs;
+                    return '\n  <option value="' + escape(option.value) + '"' + renderAttrs(optionAttrs, 'select', widget.form_control) + '>' +
+                        escape(option.label) + '</option>';
+                });
+                return '<select name="' + escape(field.html_name) + '"' + renderAttrs(attrs, 'select', widget.form_control) + '>' +
+                    options.join('') + '\n</select>';
+            case 'input':
+                return '<input type="' + escape(widget.type) + '" name="' + escape(field.html_name) + '"' +
+                    (value !== null && value !== undefined ? ' value="' + escape(value) + '"' : '') +
+                    renderAttrs(attrs, widget.type, widget.form_control) + '>';
+            default:
+                return '';
+        }
+    }
+
+    // Widgets the client can't render (multi-widgets, file inputs, etc.) are rendered by the server in state.html.
+    function renderFieldWidget(field, state, value, attrs) {
+        if (field.client_renderable === false) {
+            return (state.html && state.html[field.name]) || '';
+        }
+        return renderWidget(field, value, attrs);
+    }
+
+    function renderHelp(field) {
+        if (!field.help_text) return '';
+        return '<small id="' + escape(field.help_id) + '" class="form-text text-muted">' + field.help_text + '</small>';
+    }
+
+    function renderErrors(field, errors) {
+        if (!errors.length) return '';
+        return '<ul id="' + escape(field.errors_id) + '" class="errorlist invalid-feedback">' +
+            errors.map(function (error) { return '<li>' + escape(error) + '</li>'; }).join('') + '</ul>';
+    }
+
+    function renderField(field, state) {
+        state = state || {values: {}, errors: {}, html: {}};
+        var value = state.values ? state.values[field.name] : null;
+        var errors = (state.errors && state.errors[field.name]) || [];
+        // Same as what bootstrap_field adds to the widget attrs when there are errors.
+        var withErrors = function (attrs) {
+            if (!errors.length) return attrs;
+            return extend(attrs, {
+                'class': field.widget.invalid_class,
+                'aria-describedby': addTokens(attrs['aria-describedby'], [field.errors_id])
+            });
+        };
+        if (field.hidden) {
+            return renderFieldWidget(field, state, value, field.widget.attrs);
+        }
+        var attrs = field.client_renderable === false ? {} : withErrors(field.widget.attrs);
+        var html = '<div id="' + escape(field.group_id) + '" class="' + escape(field.group_classes) + '">';
+        if (field.show_label && !field.is_checkbox) {
+            html += '<label for="' + escape(field.auto_id) + '" id="' + escape(field.label_id) + '">' +
+                escape(field.label) + '</label>';
+        }
+        html += '<div class="controls clearfix">';
+        if (field.use_fieldset) {
+            var options = field.widget.options;
+            html += "<div id='" + escape(field.auto_id) + "'>";
+            options.forEach(function (option, index) {
+                var optionAttrs = withErrors(option.attrs);
+                if (isSelected(value, option.value)) optionAttrs = extend(optionAttrs, {checked: true});
+                html += '<div class="form-check">' +
+                    '<input type="' + escape(field.widget.type) + '" name="' + escape(field.html_name) + '" value="' +
+                    escape(option.value) + '"' + renderAttrs(optionAttrs, field.widget.type, field.widget.form_control) + '>' +
+                    '<label class="form-check-label" id="' + escape(option.id_for_label) + '-label" for="' +
+                    escape(option.id_for_label) + '">' + escape(option.label) + '</label>';
+                if (index === options.length - 1) {
+                    html += renderHelp(field) + renderErrors(field, errors);
+                }
+                html += '</div>';
+            });
+            html += '</div>';
+        } else {
+            html += renderFieldWidget(field, state, value, attrs);
+            if (field.is_checkbox) {
+                html += '<label class="form-check-label" id="' + escape(field.label_id) + '" for="' +
+                    escape(field.auto_id) + '">' + escape(field.label) + '</label>';
+            }
+            html += renderHelp(field) + renderErrors(field, errors);
+        }
+        return html + '</div></div>';
+    }
+
+    function renderForm(schema, state) {
+        state = state || {values: {}, errors: {}, html: {}, non_field_errors: []};
+        var html = (state.non_field_errors || []).map(function (error) {
+            return '<div class="alert alert-danger alert-dismissible fade show" role="alert">' + escape(error) +
+                '<button type="button" class="close" data-dismiss="alert" aria-label="Close">' +
+                '<span aria-hidden="true">&times;</span></button></div>';
+        }).join('');
+        schema.fields.forEach(function (field) {
+            if (field.hidden) html += renderField(field, state);
+        });
+        schema.fields.forEach(function (field) {
+            if (!field.hidden) html += renderField(field, state);
+        });
+        return html;
+    }
+
+    root.BootstrapForms = {
+        renderField: renderField,
+        renderForm: renderForm
+    };
+})(this);
@@ -1,14 +1,21 @@
 from django import forms, template
 from django.conf import settings
 from django.core.paginator import Paginator
+from django.forms.boundfield import BoundWidget
 from django.template import loader
+from django.template.defaultfilters import filesizeformat
 from django.utils import dateformat
 from django.utils.encoding import force_text
 from django.utils import formats
-from django.utils.html import escape
+from django.utils.functional import cached_property
+from django.utils.html import escape, format_html, html_safe
 from django.utils.safestring import mark_safe
+from django.utils.timezone import template_localtime
 from django.utils.translation import ugettext_lazy as _
+import collections
 import datetime
+import functools
+import mimetypes
 import os
 
 register = template.Library()
@@ -29,8 +36,188 @@ FONT_AWESOME_FILE_TYPE_ICON_MAP = {
     'zip': 'fa-file-archive-o',
 }
 
+# Fallback icons keyed on the major part of the guessed MIME type, used when an extension is not
+# found in FONT_AWESOME_FILE_TYPE_ICON_MAP.
+FONT_AWESOME_MIME_TYPE_ICON_MAP = {
+    'audio': 'fa-file-audio-o',
+    'image': 'fa-file-image-o',
+    'text': 'fa-file-text-o',
+    'video': 'fa-file-video-o',
+}
+
+FileListingRow = collections.namedtuple('FileListingRow', ('name', 'icon', 'size', 'modified', 'item'))
+
+
+class FieldView (object):
+    """
+    The values ``bootstrap_field`` and ``bootstrap/field.html`` need from a ``BoundField``, computed once
+    per render. Templates can use these plain attributes instead of re-evaluating ``BoundField``
+    properties (``auto_id``, ``errors``, etc.) each time they are referenced, and render the widget (or its
+    subwidgets) with ``attrs``, the widget attrs for this render.
+    """
+
+    __slots__ = ('field', 'auto_id', 'group_id', 'label_id', 'help_id', 'errors_id', 'label', 'help_text', 'errors',
+                 'required', 'extra_classes', 'group_classes', 'attrs')
+
+    def __init__(self, field, field_class, widget_class, is_checkbox=False, extra_classes='', use_fieldset=False):
+        self.field = field
+        self.auto_id = field.auto_id
+        self.group_id = '%s-group' % self.auto_id
+        self.label_id = '%s-label' % self.auto_id
+        self.help_id = '%s-help' % self.auto_id
+        self.errors_id = '%s-errors' % self.auto_id
+        self.label = field.label
+        self.help_text = field.help_text
+        self.errors = field.errors
+        self.required = field.field.required
+        self.extra_classes = extra_classes
+        classes = ['form-group', 'field-%s' % field_class, 'widget-%s' % widget_class]
+        if is_checkbox:
+            classes.append('form-check')
+        if self.required:
+            classes.append('required')
+        if extra_classes:
+            classes.append(extra_classes)
+        self.group_classes = ' '.join(classes)
+        self.attrs = widget_attrs(field, self, use_fieldset)
+
+    def widget(self):
+        """
+        Renders the field's widget with ``attrs``.
+        """
+        return self.field.as_widget(attrs=self.attrs)
+
+    def subwidgets(self):
+        """
+        Returns the field's subwidgets (radio buttons or checkboxes, for instance) rendered with ``attrs``, like
+        iterating over the ``BoundField`` would.
+        """
+        field = self.field
+        widget = field.field.widget
+        id_ = widget.attrs.get('id') or self.auto_id
+        attrs = field.build_widget_attrs(dict(self.attrs, id=id_) if id_ else dict(self.attrs))
+        return [BoundWidget(widget, subwidget, field.form.renderer)
+                for subwidget in widget.subwidgets(field.html_name, field.value(), attrs=attrs)]
+
+
+@html_safe
+class RenderedField (object):
+    """
+    The ``BoundField`` passed to field templates as ``field``. Rendering it (``{{ field }}``), its widget, or its
+    subwidgets (``{% for choice in field %}``) uses the attrs ``bootstrap_field`` computed for this render,
+    without modifying the widget. Everything else is looked up on the ``BoundField``.
+    """
+
+    def __init__(self, field, view):
+        self.bound_field = field
+        self.view = view
+
+    def __getattr__(self, name):
+        return getattr(self.bound_field, name)
+
+    def __str__(self):
+        if self.bound_field.field.show_hidden_initial:
+            return self.as_widget() + self.bound_field.as_hidden(only_initial=True)
+        return self.as_widget()
+
+    def __iter__(self):
+        return iter(self.subwidgets)
+
+    def __len__(self):
+        return len(self.subwidgets)
+
+    def __bool__(self):
+        return True
+
+    def __getitem__(self, idx):
+        # Same as BoundField, so template lookups like {{ field.errors }} fall through to attributes.
+        if not isinstance(idx, (int, slice)):
+            raise TypeError('BoundField indices must be integers or slices, not %s.' % type(idx).__name__)
+        return self.subwidgets[idx]
+
+    @cached_property
+    def subwidgets(self):
+        return self.view.subwidgets()
+
+    def as_widget(self, widget=None, attrs=None, only_initial=False):
+        if widget is None:
+            attrs = dict(self.view.attrs, **(attrs or {}))
+        return self.bound_field.as_widget(widget, attrs, only_initial)
+
+
+def add_tokens(value, *tokens):
+    """
+    Returns the space-separated ``value`` (such as a ``class`` attribute) with ``tokens`` appended, skipping
+    any that are already present.
+    """
+    existing = (value or '').split()
+    return ' '.join(existing + [t for t in tokens if t not in existing])
+
+
+def widget_attrs(field, view, use_fieldset=False):
+    """
+    Returns the widget attrs ``bootstrap_field`` renders a field with: the widget's current attrs, plus ARIA
+    attributes (and the ``is-invalid`` class) based on information on the field. The widget itself is not
+    modified, so rendering a field more than once (or from more than one thread) gives the same result.
+    """
+    attrs = dict(field.field.widget.attrs)
+    describedby = []
+    if use_fieldset:
+        describedby.append(view.label_id)
+    else:
+        attrs['aria-labelledby'] = add_tokens(attrs.get('aria-labelledby'), view.label_id)
+    if view.help_text:
+        describedby.append(view.help_id)
+    if view.errors:
+        attrs['class'] = add_tokens(attrs.get('class'), 'is-invalid')
+        describedby.append(view.errors_id)
+    if describedby:
+        attrs['aria-describedby'] = add_tokens(attrs.get('aria-describedby'), *describedby)
+    return attrs
+
+
+def form_templates(form, template=None):
+    """
+    Returns the list of templates searched by ``bootstrap_form`` for the given form.
+    """
+    templates = [
+        'bootstrap/%s.html' % form.__class__.__name__.lower(),
+        'bootstrap/form.html',
+    ]
+    if template:
+        templates.insert(0, template)
+    return templates
+
+
+def field_templates(field, template=None):
+    """
+    Returns the list of templates searched by ``bootstrap_field`` for the given bound field.
+    """
+    field_class = field.field.__class__.__name__.lower()
+    widget_class = field.field.widget.__class__.__name__.lower()
+    templates = [
+        'bootstrap/%s_%s.html' % (field.form.__class__.__name__.lower(), field.name),
+        'bootstrap/%s_%s.html' % (field_class, widget_class),
+        'bootstrap/%s.html' % field_class,
+        'bootstrap/field.html',
+    ]
+    if template:
+        templates.insert(0, template)
+    return templates
+
+
+def pager_templates(template=None):
+    """
+    Returns the list of templates searched by ``pager``.
+    """
+    templates = [
+        'bootstrap/pager.html',
+    ]
+    if template:
+        templates.insert(0, template)
+    return templates
+
 
-@register.simple_tag
 def bootstrap_form(form, template=None, **kwargs):
     """
     Renders a Django form using Bootstrap markup. See https://getbootstrap.com/docs/4.3/components/forms/
@@ -45,18 +232,12 @@ def bootstrap_form(form, template=None, **kwargs):
 
     :param form: A Django form instance
     """
-    templates = [
-        'bootstrap/%s.html' % form.__class__.__name__.lower(),
-        'bootstrap/form.html',
-    ]
-    if template:
-        templates.insert(0, template)
+    templates = form_templates(form, template)
     params = {'form': form}
     params.update(kwargs)
     return loader.render_to_string(templates, params)
 
 
-@register.simple_tag
 def bootstrap_field(field, classes='', template=None, **kwargs):
     """
     Renders a bound Django field using Bootstrap markup. See http://getbootstrap.com/css/#forms
@@ -82,56 +263,95 @@ def bootstrap_field(field, classes='', template=None, **kwargs):
         return ''
     field_class = field.field.__class__.__name__.lower()
     widget_class = field.field.widget.__class__.__name__.lower()
-    templates = [
-        'bootstrap/%s_%s.html' % (field.form.__class__.__name__.lower(), field.name),
-        'bootstrap/%s_%s.html' % (field_class, widget_class),
-        'bootstrap/%s.html' % field_class,
-        'bootstrap/field.html',
-    ]
-    if template:
-        templates.insert(0, template)
+    templates = field_templates(field, template)
     extra_classes = getattr(field.field, 'css_classes', [])
     if extra_classes:
         classes += ' ' + ' '.join(extra_classes)
 
+    is_checkbox = isinstance(field.field.widget, forms.CheckboxInput)
     use_fieldset = getattr(field.field.widget, 'use_fieldset', False)
-    describedby = set(field.field.widget.attrs.get('aria-describedby', '').split())
-    labelledby = set(field.field.widget.attrs.get('aria-labelledby', '').split())
+    view = FieldView(field, field_class, widget_class, is_checkbox, classes.strip(), use_fieldset)
 
-    # Need to shoehorn some ARIA attributes onto the widget based on information
-    # on the field
-    if use_fieldset:
-        describedby.add('%s-label' % field.auto_id)
-    else:
-        labelledby.add('%s-label' % field.auto_id)
-        field.field.widget.attrs['aria-labelledby'] = ' '.join(labelledby)
-
-    if field.help_text:
-        describedby.add('%s-help' % field.auto_id)
-    if field.errors:
-        field.field.widget.attrs['class'] = field.field.widget.attrs.get('class', '') + ' is-invalid'
-        describedby.add('%s-errors' % field.auto_id)
-    
-    if describedby:
-        field.field.widget.attrs['aria-describedby'] = ' '.join(describedby)
-    
     params = {
-        'field': field,
-        'is_checkbox': isinstance(field.field.widget, forms.CheckboxInput),
+        'field': RenderedField(field, view),
+        'field_view': view,
+        'is_checkbox': is_checkbox,
         'show_label': getattr(field.field.widget, 'show_label', True),
         'use_fieldset': use_fieldset,
         'field_class': field_class,
         'widget_class': widget_class,
-        'extra_classes': classes.strip(),
+        'extra_classes': view.extra_classes,
     }
     params.update(kwargs)
     return loader.render_to_string(templates, params)
 
 
-@register.simple_tag
-def render_readonly(field, template=None, **kwargs):
+def add_media(request, media):
+    """
+    Adds ``media`` to the media collected while rendering ``request``, to be output by ``bootstrap_media``.
+    """
+    if request is not None:
+        request._bootstrap_media = getattr(request, '_bootstrap_media', forms.Media()) + media
+
+
+@register.simple_tag(takes_context=True, name='bootstrap_form')
+def bootstrap_form_tag(context, form, template=None, **kwargs):
+    """
+    Template version of ``bootstrap_form``, which also collects the form's media for ``bootstrap_media``.
+    """
+    add_media(getattr(context, 'request', None), form.media)
+    return bootstrap_form(form, template=template, **kwargs)
+
+
+@register.simple_tag(takes_context=True, name='bootstrap_field')
+def bootstrap_field_tag(context, field, classes='', template=None, **kwargs):
+    """
+    Template version of ``bootstrap_field``, which also collects the widget's media for ``bootstrap_media``.
+    """
+    if field:
+        add_media(getattr(context, 'request', None), field.field.widget.media)
+    return bootstrap_field(field, classes=classes, template=template, **kwargs)
+
+
+@register.simple_tag(takes_context=True)
+def bootstrap_media(context, *extra, defer=True):
+    """
+    Outputs the CSS and JavaScript needed by every form (and field) rendered so far in this request using
+    ``bootstrap_form`` or ``bootstrap_field``, deduplicated, with scripts loaded using ``defer``. Typically
+    placed just before ``</body>`` in a base template. Collecting media requires the template be rendered
+    with a ``RequestContext`` (as ``render`` and ``TemplateResponse`` do), but any additional forms or
+    ``Media`` objects may also be passed in explicitly::
+
+        {% bootstrap_media %}
+        {% bootstrap_media search_form defer=False %}
+
+    Media is only output once; the collected media is reset after it is rendered.
+    """
+    request = getattr(context, 'request', None)
+    media = getattr(request, '_bootstrap_media', forms.Media())
+    for obj in extra:
+        media += getattr(obj, 'media', obj)
+    if request is not None:
+        request._bootstrap_media = forms.Media()
+    tags = list(media.render_css())
+    for path in media._js:
+        if hasattr(path, '__html__'):
+            tags.append(path.__html__())
+        elif defer:
+            tags.append(format_html('<script src="{}" defer></script>', media.absolute_path(path)))
+        else:
+            tags.append(format_html('<script src="{}"></script>', media.absolute_path(path)))
+    return mark_safe('\n'.join(tags))
+
+
+def readonly_context(field, template=None, **kwargs):
+    """
+    Returns the list of templates and the context used by ``render_readonly``, or ``None`` if the field is not
+    rendered. Converting the field's value (which may query the database, for a ``ModelChoiceField``) happens
+    here, so the rendering itself can happen elsewhere.
+    """
     if not field or field.is_hidden:
-        return ''
+        return None
     field_class = field.field.__class__.__name__.lower()
     widget_class = field.field.widget.__class__.__name__.lower()
     templates = [
@@ -156,6 +376,15 @@ def render_readonly(field, template=None, **kwargs):
         'widget_class': widget_class,
     }
     params.update(kwargs)
+    return templates, params
+
+
+@register.simple_tag
+def render_readonly(field, template=None, **kwargs):
+    context = readonly_context(field, template, **kwargs)
+    if context is None:
+        return ''
+    templates, params = context
     return loader.render_to_string(templates, params)
 
 
@@ -182,11 +411,7 @@ def pager(total, page_size=10, page=1, param='page', querystring='', spread=7, t
         page_range = range(start, start + spread)
     else:
         page_range = paginator.page_range
-    templates = [
-        'bootstrap/pager.html',
-    ]
-    if template:
-        templates.insert(0, template)
+    templates = pager_templates(template)
     return loader.render_to_string(templates, {
         'page_range': page_range,
         'page': page,
@@ -195,18 +420,11 @@ def pager(total, page_size=10, page=1, param='page', querystring='', spread=7, t
     })
 
 
-@register.simple_tag
-def render_value(obj, field_name, template=None, classes='', label=None, default='', **kwargs):
+def value_context(obj, field_name, template=None, classes='', label=None, default='', **kwargs):
     """
-    Renders a static value as a ``p.form-control-plaintext`` element wrapped in a ``div.form-group``.
-
-    The template used to render the value depends on the ContentType of the object. The following
-    templates are searched in order:
-
-        * ``<app_label>/values/<model>_<field_name>.html``
-        * ``<app_label>/values/<model>.html``
-        * ``<app_label>/value.html``
-        * ``bootstrap/value.html``
+    Returns the list of templates and the context used by ``render_value``. This is where any database
+    access happens (the ContentType lookup and evaluating related managers), so the rendering itself can
+    happen elsewhere.
     """
     from django.contrib.contenttypes.models import ContentType
     ct = ContentType.objects.get_for_model(obj)
@@ -236,6 +454,23 @@ def render_value(obj, field_name, template=None, classes='', label=None, default
         'default_value': default,
     }
     params.update(kwargs)
+    return templates, params
+
+
+@register.simple_tag
+def render_value(obj, field_name, template=None, classes='', label=None, default='', **kwargs):
+    """
+    Renders a static value as a ``p.form-control-plaintext`` element wrapped in a ``div.form-group``.
+
+    The template used to render the value depends on the ContentType of the object. The following
+    templates are searched in order:
+
+        * ``<app_label>/values/<model>_<field_name>.html``
+        * ``<app_label>/values/<model>.html``
+        * ``<app_label>/value.html``
+        * ``bootstrap/value.html``
+    """
+    templates, params = value_context(obj, field_name, template, classes, label, default, **kwargs)
     return loader.render_to_string(templates, params)
 
 
@@ -266,12 +501,105 @@ def stringify(value, sep=', ', default='', linebreaks=True, escape_html=True, sh
     return mark_safe(value)
 
 
+def register_file_type_icon(ext, icon):
+    """
+    Registers (or overrides) the Font Awesome icon used for files with the given extension. Equivalent to
+    adding it to ``FONT_AWESOME_FILE_TYPE_ICON_MAP`` directly.
+    """
+    FONT_AWESOME_FILE_TYPE_ICON_MAP[ext.lstrip('.').lower()] = icon
+
+
+@functools.lru_cache(maxsize=1024)
+def _mime_major_type(ext):
+    mime_type, _encoding = mimetypes.guess_type('file.' + ext, strict=False)
+    return mime_type.split('/', 1)[0] if mime_type else None
+
+
+def _extension_icon(ext):
+    # Only the mimetypes guess is memoized, so changes to the icon maps take effect immediately.
+    icon = FONT_AWESOME_FILE_TYPE_ICON_MAP.get(ext)
+    if icon is None and ext:
+        icon = FONT_AWESOME_MIME_TYPE_ICON_MAP.get(_mime_major_type(ext))
+    return icon
+
+
 @register.filter
 def file_extension_icon(ext, default='fa-file-o'):
-    return FONT_AWESOME_FILE_TYPE_ICON_MAP.get(ext.lstrip('.').lower(), default)
+    return _extension_icon(ext.lstrip('.').lower()) or default
 
 
 @register.filter
 def filename_icon(filename, default='fa-file-o'):
     _root, ext = os.path.splitext(filename)
     return file_extension_icon(ext, default=default)
+
+
+def iter_file_listing(files, default_icon='fa-file-o', date_format='SHORT_DATETIME_FORMAT'):
+    """
+    Lazily generates a :class:`FileListingRow` (``name``, ``icon``, ``size``, ``modified``, ``item``) for
+    each entry in ``files``, which may be filenames or objects with ``name`` and optional ``size`` and
+    ``mtime`` attributes (``mtime`` may be a timestamp or a ``datetime``). Sizes are formatted with
+    ``filesizeformat``, and dates are converted to the current time zone and formatted using ``date_format``.
+    """
+    for item in files:
+        if isinstance(item, str):
+            name, size, mtime = item, None, None
+        else:
+            name = getattr(item, 'name', '')
+            size = getattr(item, 'size', None)
+            mtime = getattr(item, 'mtime', None)
+        if isinstance(mtime, (int, float)):
+            if settings.USE_TZ:
+                mtime = datetime.datetime.fromtimestamp(mtime, tz=datetime.timezone.utc)
+            else:
+                mtime = datetime.datetime.fromtimestamp(mtime)
+        _root, ext = os.path.splitext(name)
+        yield FileListingRow(
+            name,
+            _extension_icon(ext.lstrip('.').lower()) or default_icon,
+            filesizeformat(size) if size is not None else '',
+            formats.date_format(template_localtime(mtime), date_format) if mtime is not None else '',
+            item,
+        )
+
+
+class FileListing (object):
+    """
+    The rows of a file listing, as returned by the ``file_listing`` templatetag. Iterating over it generates
+    rows lazily using :func:`iter_file_listing`, and rendering it directly uses ``template`` (by default,
+    ``bootstrap/file_listing.html``).
+    """
+
+    def __init__(self, files, default_icon='fa-file-o', date_format='SHORT_DATETIME_FORMAT', template=None):
+        self.files = files
+        self.default_icon = default_icon
+        self.date_format = date_format
+        self.template = template
+
+    def __iter__(self):
+        return iter_file_listing(self.files, default_icon=self.default_icon, date_format=self.date_format)
+
+    def __html__(self):
+        templates = ['bootstrap/file_listing.html']
+        if self.template:
+            templates.insert(0, self.template)
+        return loader.render_to_string(templates, {'rows': self})
+
+    __str__ = __html__
+
+
+@register.simple_tag
+def file_listing(files, default_icon='fa-file-o', date_format='SHORT_DATETIME_FORMAT', template=None):
+    """
+    Returns a :class:`FileListing` of ``files`` (see :func:`iter_file_listing`). Used on its own, the listing
+    is rendered using ``bootstrap/file_listing.html``; used with ``as``, the rows can be rendered directly::
+
+        {% file_listing folder.files as rows %}
+        {% for row in rows %}
+            <li><span class="fa {{ row.icon }}"></span> {{ row.name }} ({{ row.size }}, {{ row.modified }})</li>
+        {% endfor %}
+
+    Note that ``{% for %}`` builds a list of all the rows before rendering them. To stream very large listings,
+    use :func:`iter_file_listing` with a ``StreamingHttpResponse`` instead.
+    """
+    return FileListing(files, default_icon=default_icon, date_format=date_format, template=template)
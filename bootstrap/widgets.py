@@ -1,9 +1,60 @@
 from django import forms
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.exceptions import EmptyResultSet
+from django.db.models.signals import post_delete, post_save
+from django.forms.models import ModelChoiceIterator
 from django.forms.utils import flatatt
 from django.template import loader
-from django.utils.translation import ugettext_lazy as _
+from django.utils.encoding import force_text
+from django.utils.translation import get_language, ugettext_lazy as _
 
-import collections
+import collections.abc
+import copy
+import hashlib
+import threading
+import uuid
+
+JQUERY_JS = 'jquery/jquery.min.js'
+
+DATEPICKER_MEDIA = {
+    'css': {'all': ('datepicker/css/bootstrap-datepicker3.min.css',)},
+    'js': ('datepicker/js/bootstrap-datepicker.min.js',),
+}
+
+SELECTIZE_MEDIA = {
+    'css': {'all': ('selectize/css/selectize.bootstrap3.css',)},
+    'js': ('selectize/js/selectize.min.js',),
+}
+
+
+def widget_media(definition):
+    """
+    Returns a ``forms.Media`` for ``definition``. The plugins need jQuery, which is expected to already be on the
+    page (usually loaded along with Bootstrap's own plugins); set ``BOOTSTRAP_MEDIA_JQUERY = True`` to include the
+    bundled copy first.
+    """
+    js = tuple(definition.get('js', ()))
+    if getattr(settings, 'BOOTSTRAP_MEDIA_JQUERY', False):
+        js = (JQUERY_JS,) + js
+    return forms.Media(css=definition.get('css'), js=js)
+
+
+class PluginWidget (object):
+    """
+    Base class for widgets enhanced by a jQuery plugin, whose media (see :func:`widget_media`) is declared by
+    ``plugin_media``.
+    """
+
+    plugin_media = {}
+    """
+    The plugin's CSS and JavaScript, as keyword arguments for ``forms.Media``.
+    """
+
+    @property
+    def media(self):
+        return widget_media(self.plugin_media)
 
 
 class TemplateWidget (forms.Widget):
@@ -27,7 +78,7 @@ class TemplateWidget (forms.Widget):
     def __init__(self, template_name=None, attrs=None, **extra_context):
         if template_name:
             self.template_name = template_name
-        self.extra_context.update(extra_context)
+        self.extra_context = dict(self.extra_context, **extra_context)
         super(TemplateWidget, self).__init__(attrs=attrs)
 
     def render(self, name, value, attrs=None, renderer=None):
@@ -46,6 +97,126 @@ class TemplateWidget (forms.Widget):
         return template.render(params)
 
 
+_watched_models = set()
+_watched_lock = threading.Lock()
+
+
+def _choices_cache():
+    # Invalidations only reach other processes through a shared cache, so choices aren't cached in a
+    # process-local one.
+    cache = caches[getattr(settings, 'BOOTSTRAP_CHOICES_CACHE', 'default')]
+    return None if isinstance(cache, LocMemCache) else cache
+
+
+def _choices_version_key(model):
+    return 'bootstrap:choices-version:%s' % model._meta.concrete_model._meta.label_lower
+
+
+def invalidate_choices(model):
+    """
+    Invalidates any cached choices for querysets of ``model``. Called on ``post_save`` and ``post_delete`` for
+    models whose choices are cached, but may also be called directly (after a ``QuerySet.update``, say).
+    """
+    cache = _choices_cache()
+    if cache is not None:
+        cache.set(_choices_version_key(model), uuid.uuid4().hex, None)
+
+
+def _invalidate_choices(sender, **kwargs):
+    invalidate_choices(sender)
+
+
+def watch_model(model):
+    """
+    Connects the signals that invalidate cached choices for ``model`` (and its concrete model, for proxies).
+    """
+    with _watched_lock:
+        for m in {model, model._meta.concrete_model}:
+            if m not in _watched_models:
+                _watched_models.add(m)
+                uid = 'bootstrap-choices-%s' % m._meta.label_lower
+                post_save.connect(_invalidate_choices, sender=m, dispatch_uid=uid)
+                post_delete.connect(_invalidate_choices, sender=m, dispatch_uid=uid)
+
+
+def cached_choices(iterator):
+    """
+    Returns the evaluated ``(value, label)`` choices for a ``ModelChoiceIterator``, cached across requests
+    per queryset and language. Values are kept as the iterator returns them (``ModelChoiceIteratorValue``
+    on Django 3.1+, so ``option.value.instance`` still works in templates). Choices are not cached if
+    ``BOOTSTRAP_CHOICES_CACHE`` is a ``LocMemCache``.
+    """
+    cache = _choices_cache()
+    if cache is None:
+        return list(iterator)
+    queryset = iterator.queryset
+    watch_model(queryset.model)
+    try:
+        sql, params = queryset.query.sql_with_params()
+    except EmptyResultSet:
+        return list(iterator)
+    version = cache.get_or_set(_choices_version_key(queryset.model), uuid.uuid4().hex, None)
+    field = iterator.field
+    key_parts = (
+        queryset.model._meta.label_lower,
+        queryset.db,
+        sql,
+        params,
+        '%s.%s' % (field.__class__.__module__, field.__class__.__qualname__),
+        force_text(field.empty_label) if field.empty_label is not None else None,
+        get_language(),
+        version,
+    )
+    key = 'bootstrap:choices:%s' % hashlib.md5(repr(key_parts).encode('utf-8')).hexdigest()
+    choices = cache.get(key)
+    if choices is None:
+        choices = [(value, force_text(label)) for value, label in iterator]
+        cache.set(key, choices, getattr(settings, 'BOOTSTRAP_CHOICES_TIMEOUT', 86400))
+    return choices
+
+
+class CachedChoicesWidget (object):
+    """
+    Base class for choice widgets that can cache the choices of a ``ModelChoiceField`` in the Django cache
+    (``BOOTSTRAP_CHOICES_CACHE``, for ``BOOTSTRAP_CHOICES_TIMEOUT`` seconds), so rendering doesn't run the
+    queryset every time. Turned on by passing ``cache_choices=True`` or setting it on a subclass. Cached
+    choices are invalidated when an instance of the queryset's model is saved or deleted, which only reaches
+    other processes through a shared cache (memcached, Redis, database, etc.), so nothing is cached if
+    ``BOOTSTRAP_CHOICES_CACHE`` is a ``LocMemCache``.
+    """
+
+    cache_choices = False
+    """
+    Whether to cache ``ModelChoiceField`` choices across requests.
+    """
+
+    def __init__(self, *args, **kwargs):
+        cache_choices = kwargs.pop('cache_choices', None)
+        super(CachedChoicesWidget, self).__init__(*args, **kwargs)
+        if cache_choices is not None:
+            self.cache_choices = cache_choices
+
+    @property
+    def choices(self):
+        if self.cache_choices and isinstance(self._choices, ModelChoiceIterator) and _choices_cache() is not None:
+            return cached_choices(self._choices)
+        return self._choices
+
+    @choices.setter
+    def choices(self, value):
+        self._choices = value
+        if self.cache_choices and isinstance(value, ModelChoiceIterator):
+            watch_model(value.queryset.model)
+
+    def __deepcopy__(self, memo):
+        # Same as ChoiceWidget.__deepcopy__, without evaluating the choices.
+        obj = copy.copy(self)
+        obj.attrs = self.attrs.copy()
+        obj._choices = copy.copy(self._choices)
+        memo[id(self)] = obj
+        return obj
+
+
 class BootstrapWidget (object):
     """
     Base class for most widgets implemented here (with the exception of :class:`TemplateWidget`).
@@ -100,9 +271,10 @@ class AutofocusTextarea (Textarea):
     extra_attrs = {'autofocus': 'autofocus'}
 
 
-class DateInput (BootstrapWidget, forms.DateInput):
+class DateInput (PluginWidget, BootstrapWidget, forms.DateInput):
     """ Bootstrap version of ``forms.DateInput``. The input is rendered with an extra "date" class. """
     css_classes = BootstrapWidget.css_classes + ('date',)
+    plugin_media = DATEPICKER_MEDIA
 
 
 class TimeInput (BootstrapWidget, forms.TimeInput):
@@ -110,22 +282,25 @@ class TimeInput (BootstrapWidget, forms.TimeInput):
     css_classes = BootstrapWidget.css_classes + ('time',)
 
 
-class DateTimeInput (BootstrapWidget, forms.DateTimeInput):
+class DateTimeInput (PluginWidget, BootstrapWidget, forms.DateTimeInput):
     """ Bootstrap version of ``forms.TimeInput``. The input is rendered with an extra "time" class. """
     css_classes = BootstrapWidget.css_classes + ('datetime',)
+    plugin_media = DATEPICKER_MEDIA
 
 
-class Select (BootstrapWidget, forms.Select):
+class Select (CachedChoicesWidget, PluginWidget, BootstrapWidget, forms.Select):
     """ Bootstrap version of ``forms.Select`` """
     css_classes = ['custom-select']
+    plugin_media = SELECTIZE_MEDIA
 
 
-class SelectMultiple (BootstrapWidget, forms.SelectMultiple):
+class SelectMultiple (CachedChoicesWidget, PluginWidget, BootstrapWidget, forms.SelectMultiple):
     """ Bootstrap version of ``forms.SelectMultiple`` """
     css_classes = ['custom-select']
+    plugin_media = SELECTIZE_MEDIA
 
 
-class RadioSelect (BootstrapWidget, forms.RadioSelect):
+class RadioSelect (CachedChoicesWidget, BootstrapWidget, forms.RadioSelect):
     """ Bootstrap version of ``forms.RadioSelect`` """
     css_classes = ['form-check-input']
     use_fieldset = True
@@ -136,7 +311,7 @@ class CheckboxInput (BootstrapWidget, forms.CheckboxInput):
     css_classes = ['form-check-input']
 
 
-class CheckboxSelectMultiple (BootstrapWidget, forms.CheckboxSelectMultiple):
+class CheckboxSelectMultiple (CachedChoicesWidget, BootstrapWidget, forms.CheckboxSelectMultiple):
     """ Bootstrap version of ``forms.CheckboxSelectMultiple`` """
     css_classes = ['form-check-input']
     use_fieldset = True
@@ -208,7 +383,7 @@ class FileInput (BootstrapWidget, forms.FileInput):
     """ Bootstrap version of ``forms.FileInput`` """
     css_classes = []
 
-class ModelWidgets (collections.Mapping):
+class ModelWidgets (collections.abc.Mapping):
 
     widget_map = {
        forms.TextInput: TextInput,
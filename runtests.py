@@ -0,0 +1,14 @@
+#!/usr/bin/env python
+from django.conf import settings
+from django.test.utils import get_runner
+
+import django
+import os
+import sys
+
+if __name__ == '__main__':
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tests.settings')
+    django.setup()
+    TestRunner = get_runner(settings)
+    failures = TestRunner().run_tests(sys.argv[1:] or ['tests'])
+    sys.exit(bool(failures))
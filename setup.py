@@ -9,8 +9,11 @@ setup(
     author_email='watsond@imsweb.com',
     url='https://github.com/imsweb/django-bootstrap',
     license='BSD',
-    packages=find_packages(),
+    packages=find_packages(exclude=('tests', 'tests.*')),
     include_package_data=True,
+    extras_require={
+        'subset': ['fonttools', 'brotli'],
+    },
     classifiers=[
         'Development Status :: 5 - Production/Stable',
         'Intended Audience :: Developers',
@@ -0,0 +1,88 @@
+"""
+ASGI latency benchmark for the ``bootstrap.aio`` helpers. Requests the same page (two forms and a set of values)
+from a sync view rendered with the templatetags and from an async view rendered with ``bootstrap.aio``, at
+increasing numbers of concurrent requests, and reports latency percentiles and throughput::
+
+    python -m tests.bench_async --requests 200 --concurrency 1 10 50
+"""
+
+from django.test import AsyncClient
+
+from . import utils
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+
+
+async def measure(client, url, requests, concurrency):
+    """
+    Issues ``requests`` GET requests for ``url`` using ``concurrency`` concurrent clients. Returns the sorted
+    list of latencies (in seconds), the elapsed time, and the set of distinct response bodies.
+    """
+    latencies = []
+    bodies = set()
+    remaining = iter(range(requests))
+
+    async def worker():
+        for _i in remaining:
+            start = time.perf_counter()
+            response = await client.get(url)
+            latencies.append(time.perf_counter() - start)
+            assert response.status_code == 200, response.status_code
+            bodies.add(response.content)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[worker() for _i in range(concurrency)])
+    return sorted(latencies), time.perf_counter() - start, bodies
+
+
+def percentile(values, pct):
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+async def run(pk, requests=200, concurrency=(1, 10, 50), stream=None):
+    """
+    Benchmarks the sync and async views for the ``Request`` with primary key ``pk``. Returns a list of
+    ``(view, concurrency, p50, p95, requests_per_second)`` tuples, and raises ``AssertionError`` if the two
+    views render different pages. Writes a table of the results to ``stream``, if given.
+    """
+    client = AsyncClient()
+    urls = {
+        'sync': '/requests/%d/' % pk,
+        'async': '/async/requests/%d/' % pk,
+    }
+    pages = {}
+    for name, url in urls.items():
+        # Warm up the template cache, ContentType cache, etc.
+        pages[name] = (await client.get(url)).content
+    assert pages['sync'] == pages['async'], 'The sync and async views rendered different pages.'
+    results = []
+    for num in concurrency:
+        for name, url in urls.items():
+            latencies, elapsed, bodies = await measure(client, url, requests, num)
+            assert bodies == {pages[name]}, 'Concurrent requests to %s rendered different pages.' % url
+            row = (name, num, statistics.median(latencies), percentile(latencies, 95), requests / elapsed)
+            results.append(row)
+            if stream is not None:
+                stream.write('%-6s %4d concurrent: p50 %7.1f ms, p95 %7.1f ms, %6.1f requests/s\n' % (
+                    name, num, 1000 * row[2], 1000 * row[3], row[4]))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=200, help='Requests per view and level (default 200).')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 10, 50],
+                        help='Numbers of concurrent requests (default 1 10 50).')
+    args = parser.parse_args(argv)
+    utils.setup()
+    with utils.test_database():
+        pk = utils.create_request().pk
+        asyncio.run(run(pk, args.requests, args.concurrency, stream=sys.stdout))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+Counts how many times ``BoundField`` properties and methods are evaluated while rendering a large form with
+``bootstrap_form``, and times the render::
+
+    python -m tests.bench_fields --fields 60 --repeat 20
+"""
+
+from django.forms.boundfield import BoundField
+
+from bootstrap.templatetags.bootstrap import bootstrap_form
+
+from . import utils
+
+import argparse
+import collections
+import contextlib
+import sys
+import time
+
+COUNTED = ('auto_id', 'errors', 'is_hidden', 'id_for_label', 'data', 'value', 'initial', 'as_widget',
+           'build_widget_attrs', 'label_tag', 'css_classes', 'widget_type')
+
+
+def large_form(size=60):
+    """
+    Returns a form class with ``size`` each of text inputs, checkboxes, and radio selects, and a non-field error.
+    """
+    from django import forms
+
+    from bootstrap import widgets
+
+    def clean(self):
+        raise forms.ValidationError('Something is wrong.')
+
+    attrs = {'clean': clean}
+    for i in range(size):
+        attrs['text%d' % i] = forms.CharField(widget=widgets.TextInput, help_text='Help %d' % i)
+        attrs['check%d' % i] = forms.BooleanField(widget=widgets.CheckboxInput, required=False)
+        attrs['radio%d' % i] = forms.ChoiceField(widget=widgets.RadioSelect, choices=[('1', 'One'), ('2', 'Two')])
+    return type('LargeForm', (forms.Form,), attrs)
+
+
+@contextlib.contextmanager
+def count_accesses(names=COUNTED):
+    """
+    Patches the ``BoundField`` attributes in ``names`` (properties, cached properties, or methods) to count how
+    many times each is evaluated, yielding a ``Counter`` keyed by attribute name.
+    """
+    counts = collections.Counter()
+    originals = {}
+
+    def counted(name, func):
+        def wrapper(*args, **kwargs):
+            counts[name] += 1
+            return func(*args, **kwargs)
+        return wrapper
+
+    for name in names:
+        if name not in BoundField.__dict__:
+            continue
+        attr = originals[name] = BoundField.__dict__[name]
+        if isinstance(attr, property):
+            setattr(BoundField, name, property(counted(name, attr.fget)))
+        elif hasattr(attr, 'func'):
+            # cached_property, which is only evaluated once per BoundField anyway; count the evaluations.
+            setattr(BoundField, name, property(counted(name, attr.func)))
+        else:
+            setattr(BoundField, name, counted(name, attr))
+    try:
+        yield counts
+    finally:
+        for name, attr in originals.items():
+            setattr(BoundField, name, attr)
+
+
+def run(size=60, repeat=20, stream=None):
+    """
+    Renders a bound and an unbound ``large_form(size)``, returning a ``(counts, seconds)`` tuple for each, where
+    ``counts`` are per-field attribute evaluations for a single render and ``seconds`` is the time taken to
+    render it ``repeat`` times. Writes a table of the results to ``stream``, if given.
+    """
+    form_class = large_form(size)
+    num_fields = len(form_class.base_fields)
+    results = {}
+    for kind, data in (('unbound', None), ('bound', {'text1': 'x', 'radio1': '3'})):
+        bootstrap_form(form_class(data))
+        with count_accesses() as counts:
+            bootstrap_form(form_class(data))
+        start = time.perf_counter()
+        for _i in range(repeat):
+            bootstrap_form(form_class(data))
+        elapsed = time.perf_counter() - start
+        per_field = {name: count / num_fields for name, count in counts.items()}
+        results[kind] = (per_field, elapsed)
+        if stream is not None:
+            stream.write('%s form, %d fields: %.1f ms/render\n' % (kind, num_fields, 1000 * elapsed / repeat))
+            for name in sorted(per_field):
+                stream.write('    %-20s %6.2f per field\n' % (name, per_field[name]))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--fields', type=int, default=60, help='Number of fields of each kind (default 60).')
+    parser.add_argument('--repeat', type=int, default=20, help='Number of timed renders (default 20).')
+    args = parser.parse_args(argv)
+    utils.setup()
+    run(args.fields, args.repeat, stream=sys.stdout)
+
+
+if __name__ == '__main__':
+    main()
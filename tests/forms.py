@@ -0,0 +1,36 @@
+from django import forms
+
+from bootstrap import widgets
+
+from .models import Request
+
+COLORS = [('red', 'Red'), ('green', 'Green'), ('blue', 'Blue')]
+SIZES = [('s', 'Small'), ('m', 'Medium'), ('l', 'Large')]
+
+
+class ExampleForm (forms.Form):
+    name = forms.CharField(widget=widgets.TextInput, help_text='Your full name')
+    notes = forms.CharField(widget=widgets.Textarea, required=False)
+    color = forms.ChoiceField(widget=widgets.RadioSelect, choices=COLORS)
+    sizes = forms.MultipleChoiceField(widget=widgets.CheckboxSelectMultiple, choices=SIZES, required=False)
+    agree = forms.BooleanField(widget=widgets.CheckboxInput)
+    when = forms.DateField(widget=widgets.DateInput, required=False)
+    token = forms.CharField(widget=forms.HiddenInput, required=False)
+
+
+ExampleFormSet = forms.formset_factory(ExampleForm, extra=3)
+
+
+class RequestForm (forms.ModelForm):
+
+    class Meta:
+        model = Request
+        fields = ('name', 'email', 'category', 'tags', 'submitted', 'urgent')
+        widgets = {
+            'name': widgets.TextInput,
+            'email': widgets.EmailInput,
+            'category': widgets.Select,
+            'tags': widgets.CheckboxSelectMultiple,
+            'submitted': widgets.DateInput,
+            'urgent': widgets.CheckboxInput,
+        }
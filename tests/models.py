@@ -0,0 +1,23 @@
+from django.db import models
+
+
+class Category (models.Model):
+    name = models.CharField(max_length=100)
+
+    class Meta:
+        ordering = ('name',)
+
+    def __str__(self):
+        return self.name
+
+
+class Request (models.Model):
+    name = models.CharField(max_length=100)
+    email = models.EmailField(blank=True)
+    category = models.ForeignKey(Category, on_delete=models.CASCADE)
+    tags = models.ManyToManyField(Category, related_name='tagged', blank=True)
+    submitted = models.DateField(null=True, blank=True)
+    urgent = models.BooleanField(default=False)
+
+    def __str__(self):
+        return self.name
@@ -0,0 +1,103 @@
+"""
+Multi-threaded stress test and benchmark for rendering. Renders forms, formsets, pagers, and values on 1 to N
+threads, checks every render against a single-threaded baseline, and reports the throughput at each thread
+count::
+
+    python -m tests.stress --threads 8 --count 2000
+"""
+
+from bootstrap.templatetags.bootstrap import bootstrap_field, bootstrap_form, pager, render_value, stringify
+
+from . import utils
+
+import argparse
+import concurrent.futures
+import sys
+import time
+
+VALUE_FIELDS = ('name', 'email', 'category', 'tags', 'submitted', 'urgent')
+
+
+def renderers(obj):
+    """
+    Returns the list of render functions (each taking an iteration number) exercised by the stress test.
+    """
+    from .forms import ExampleForm, ExampleFormSet, RequestForm
+
+    # A single bound form rendered by every thread, which catches any state left behind on its widgets. Its
+    # errors are computed up front, since full_clean itself is not meant to be called concurrently.
+    shared = ExampleForm({'name': '', 'color': 'purple'}, prefix='shared')
+    shared.errors
+
+    def render_form(i):
+        return bootstrap_form(ExampleForm({'name': str(i), 'color': 'red', 'agree': 'on'} if i % 2 else None))
+
+    def render_formset(i):
+        return ''.join(bootstrap_form(form) for form in ExampleFormSet(prefix='set%d' % (i % 5)))
+
+    def render_model_form(i):
+        return bootstrap_form(RequestForm(instance=obj))
+
+    def render_pager(i):
+        return pager(1000, page=i % 50 + 1) + stringify([i, None, True])
+
+    def render_values(i):
+        return ''.join(render_value(obj, name) for name in VALUE_FIELDS)
+
+    def render_shared(i):
+        return bootstrap_field(shared['name']) + bootstrap_form(shared)
+
+    return [render_form, render_formset, render_model_form, render_pager, render_values, render_shared]
+
+
+def render_all(funcs, count, threads=None):
+    """
+    Runs ``count`` renders cycling through ``funcs``, on a pool of ``threads`` threads (or in the calling
+    thread if ``threads`` is ``None``), and returns the results in order.
+    """
+    def render(i):
+        return funcs[i % len(funcs)](i)
+    if threads is None:
+        return [render(i) for i in range(count)]
+    with concurrent.futures.ThreadPoolExecutor(threads) as executor:
+        return list(executor.map(render, range(count)))
+
+
+def run(obj, threads=(1, 2, 4, 8), count=2000, stream=None):
+    """
+    Renders ``count`` times in the calling thread for a baseline, then again for each number of ``threads``.
+    Returns a list of ``(threads, renders_per_second, mismatches)`` tuples, the first being the baseline (with
+    ``threads`` of ``None``). Writes a table of the results to ``stream``, if given.
+    """
+    funcs = renderers(obj)
+    # Warm up the template cache, ContentType cache, etc.
+    render_all(funcs, len(funcs))
+    results = []
+    baseline = None
+    for num in (None,) + tuple(threads):
+        start = time.perf_counter()
+        output = render_all(funcs, count, num)
+        rate = count / (time.perf_counter() - start)
+        if baseline is None:
+            baseline = output
+        mismatches = sum(a != b for a, b in zip(output, baseline))
+        results.append((num, rate, mismatches))
+        if stream is not None:
+            stream.write('%-10s %10.1f renders/s %6d mismatches\n' % (num or 'baseline', rate, mismatches))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--threads', type=int, default=8, help='Maximum number of threads (default 8).')
+    parser.add_argument('--count', type=int, default=2000, help='Number of renders per run (default 2000).')
+    args = parser.parse_args(argv)
+    threads = [n for n in (1, 2, 4, 8, 16, 32, 64) if n < args.threads] + [args.threads]
+    utils.setup()
+    with utils.test_database():
+        results = run(utils.create_request(), threads=threads, count=args.count, stream=sys.stdout)
+    return 1 if any(mismatches for _num, _rate, mismatches in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
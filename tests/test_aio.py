@@ -0,0 +1,60 @@
+from asgiref.sync import sync_to_async
+from django.db import connection
+from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+
+from bootstrap import aio
+from bootstrap.templatetags.bootstrap import bootstrap_form, render_readonly, render_value
+
+from .forms import RequestForm
+from .utils import create_request
+from .views import VALUE_FIELDS
+
+from unittest import mock
+import asyncio
+
+
+class AsyncRenderTests (TransactionTestCase):
+
+    def setUp(self):
+        self.req = create_request()
+        self.pool_queries = []
+        call = aio._call
+
+        def counting_call(func, *args, **kwargs):
+            with CaptureQueriesContext(connection) as queries:
+                result = call(func, *args, **kwargs)
+            self.pool_queries.extend(q['sql'] for q in queries.captured_queries)
+            return result
+
+        patcher = mock.patch.object(aio, '_call', counting_call)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_forms(self):
+        return [RequestForm(instance=self.req), RequestForm({'name': '', 'category': '999'})]
+
+    async def test_forms(self):
+        forms = await sync_to_async(self.make_forms)()
+        rendered = await aio.abootstrap_forms(forms)
+        self.assertEqual(self.pool_queries, [])
+        expected = await sync_to_async(lambda: [bootstrap_form(f) for f in self.make_forms()])()
+        self.assertEqual(rendered, expected)
+
+    async def test_readonly(self):
+        form = (await sync_to_async(self.make_forms)())[0]
+        rendered = await asyncio.gather(*[aio.arender_readonly(form[name]) for name in ('category', 'tags')])
+        self.assertEqual(self.pool_queries, [])
+        expected = await sync_to_async(lambda: [render_readonly(form['category']), render_readonly(form['tags'])])()
+        self.assertEqual(rendered, expected)
+
+    async def test_values(self):
+        rendered = await aio.arender_values(self.req, VALUE_FIELDS)
+        self.assertEqual(self.pool_queries, [])
+        expected = await sync_to_async(lambda: [render_value(self.req, name) for name in VALUE_FIELDS])()
+        self.assertEqual(rendered, expected)
+
+    async def test_asgi_views(self):
+        response = await self.async_client.get('/requests/%d/' % self.req.pk)
+        aresponse = await self.async_client.get('/async/requests/%d/' % self.req.pk)
+        self.assertEqual(aresponse.content, response.content)
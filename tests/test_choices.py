@@ -0,0 +1,64 @@
+from django import forms
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from bootstrap import widgets
+from bootstrap.templatetags.bootstrap import bootstrap_form
+
+from .models import Category
+
+
+class ChoicesForm (forms.Form):
+    category = forms.ModelChoiceField(Category.objects.all(), widget=widgets.Select(cache_choices=True))
+    tags = forms.ModelMultipleChoiceField(Category.objects.all(), required=False,
+                                          widget=widgets.CheckboxSelectMultiple(cache_choices=True))
+
+
+class UncachedChoicesForm (forms.Form):
+    category = forms.ModelChoiceField(Category.objects.all(), widget=widgets.Select)
+    tags = forms.ModelMultipleChoiceField(Category.objects.all(), required=False,
+                                          widget=widgets.CheckboxSelectMultiple)
+
+
+@override_settings(BOOTSTRAP_CHOICES_CACHE='shared')
+class CachedChoicesTests (TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.categories = [Category.objects.create(name='Category %d' % i) for i in range(5)]
+
+    def setUp(self):
+        caches['shared'].clear()
+
+    def test_warm_renders(self):
+        html = bootstrap_form(ChoicesForm())
+        bound = ChoicesForm({'category': self.categories[1].pk})
+        self.assertTrue(bound.is_valid())
+        with self.assertNumQueries(0):
+            self.assertEqual(bootstrap_form(ChoicesForm()), html)
+            self.assertEqual(bootstrap_form(bound).count('selected'), 1)
+        self.assertEqual(bootstrap_form(UncachedChoicesForm()), html)
+
+    @override_settings(BOOTSTRAP_CHOICES_CACHE='default')
+    def test_locmem_not_cached(self):
+        with CaptureQueriesContext(connection) as uncached:
+            bootstrap_form(UncachedChoicesForm())
+        bootstrap_form(ChoicesForm())
+        with self.assertNumQueries(len(uncached)):
+            bootstrap_form(ChoicesForm())
+
+    def test_invalidation(self):
+        bootstrap_form(ChoicesForm())
+        Category.objects.create(name='New Category')
+        self.assertIn('New Category', bootstrap_form(ChoicesForm()))
+        self.categories[0].delete()
+        self.assertNotIn('Category 0', bootstrap_form(ChoicesForm()))
+
+    def test_iterator_values(self):
+        bootstrap_form(ChoicesForm())
+        with self.assertNumQueries(0):
+            choices = ChoicesForm().fields['category'].widget.choices
+        self.assertEqual(choices[0], ('', '---------'))
+        self.assertEqual([value.instance for value, _label in choices[1:]], self.categories)
@@ -0,0 +1,12 @@
+from django.test import SimpleTestCase
+
+from . import bench_fields
+
+
+class FieldAccessTests (SimpleTestCase):
+
+    def test_bound_field_evaluations(self):
+        for kind, (per_field, _elapsed) in bench_fields.run(size=3, repeat=1).items():
+            # FieldView evaluates these once; the rest come from Django rendering the widget.
+            self.assertEqual(per_field['errors'], 1, kind)
+            self.assertLessEqual(per_field['auto_id'], 4, kind)
@@ -0,0 +1,90 @@
+from django.contrib import messages
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase
+from django.utils import translation
+
+from bootstrap.fingerprints import form_fingerprint, render_etag
+
+from .forms import ExampleForm
+
+import types
+
+
+class RenderEtagTests (SimpleTestCase):
+
+    def setUp(self):
+        self.calls = 0
+
+        def view(request):
+            self.calls += 1
+            return HttpResponse('page')
+
+        self.view = render_etag(lambda request: ['page', 1])(view)
+        self.shared_view = render_etag(lambda request: ['page', 1], include_request=False)(view)
+
+    def get(self, view=None, user=1, csrf='token', etag=None, message=None):
+        request = RequestFactory().get('/', HTTP_IF_NONE_MATCH=etag) if etag else RequestFactory().get('/')
+        request.user = types.SimpleNamespace(pk=user)
+        request.META['CSRF_COOKIE'] = csrf
+        request._messages = CookieStorage(request)
+        if message:
+            messages.info(request, message)
+        return (view or self.view)(request)
+
+    def test_not_modified(self):
+        etag = self.get()['ETag']
+        response = self.get(etag=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(self.calls, 1)
+
+    def test_request_state(self):
+        etag = self.get()['ETag']
+        for kwargs in ({'user': 2}, {'user': None}, {'csrf': 'rotated'}):
+            response = self.get(etag=etag, **kwargs)
+            self.assertEqual(response.status_code, 200, kwargs)
+            self.assertNotEqual(response['ETag'], etag, kwargs)
+        self.assertEqual(self.calls, 4)
+
+    def test_pending_messages(self):
+        etag = self.get()['ETag']
+        response = self.get(etag=etag, message='Saved.')
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header('ETag'))
+        self.assertEqual(self.calls, 2)
+
+    def test_without_request_state(self):
+        etag = self.get(self.shared_view)['ETag']
+        response = self.get(self.shared_view, user=2, csrf='rotated', etag=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(self.calls, 1)
+        self.assertNotEqual(self.get()['ETag'], etag)
+
+
+class FormFingerprintTests (SimpleTestCase):
+
+    data = {'name': 'Jane', 'color': 'red', 'agree': 'on'}
+
+    def test_bound_data(self):
+        unbound = form_fingerprint(ExampleForm())
+        self.assertEqual(form_fingerprint(ExampleForm()), unbound)
+        bound = form_fingerprint(ExampleForm(self.data))
+        self.assertNotEqual(bound, unbound)
+        self.assertNotEqual(form_fingerprint(ExampleForm(dict(self.data, name='John'))), bound)
+
+    def test_errors(self):
+        form = ExampleForm(self.data)
+        valid = form_fingerprint(form)
+        form.add_error(None, 'Something is wrong.')
+        self.assertNotEqual(form_fingerprint(form), valid)
+
+    def test_language(self):
+        with translation.override('en'):
+            english = form_fingerprint(ExampleForm())
+        with translation.override('fr'):
+            self.assertNotEqual(form_fingerprint(ExampleForm()), english)
+
+    def test_template(self):
+        default = form_fingerprint(ExampleForm())
+        self.assertEqual(form_fingerprint(ExampleForm(), template='bootstrap/missing.html'), default)
+        self.assertNotEqual(form_fingerprint(ExampleForm(), template='tests/request_detail.html'), default)
@@ -0,0 +1,91 @@
+from django import forms
+from django.template import engines
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from bootstrap import widgets
+
+from .forms import SIZES
+
+DATEPICKER_JS = '<script src="/static/datepicker/js/bootstrap-datepicker.min.js" defer></script>'
+DATEPICKER_CSS = '/static/datepicker/css/bootstrap-datepicker3.min.css'
+SELECTIZE_JS = '<script src="/static/selectize/js/selectize.min.js" defer></script>'
+JQUERY_JS = '<script src="/static/jquery/jquery.min.js" defer></script>'
+
+
+class DateForm (forms.Form):
+    start = forms.DateField(widget=widgets.DateInput)
+    end = forms.DateTimeField(widget=widgets.DateTimeInput)
+
+
+class SelectForm (forms.Form):
+    size = forms.ChoiceField(widget=widgets.Select, choices=SIZES)
+    when = forms.DateField(widget=widgets.DateInput)
+
+
+class PlainForm (forms.Form):
+    name = forms.CharField(widget=widgets.TextInput)
+    agree = forms.BooleanField(widget=widgets.CheckboxInput)
+
+
+class MediaTests (SimpleTestCase):
+
+    def render(self, source, request=True, **context):
+        template = engines['django'].from_string('{% load bootstrap %}' + source)
+        return template.render(context, RequestFactory().get('/') if request else None)
+
+    def test_collected(self):
+        html = self.render('{% bootstrap_form form %}{% bootstrap_media %}', form=DateForm())
+        self.assertEqual(html.count(DATEPICKER_JS), 1)
+        self.assertEqual(html.count(DATEPICKER_CSS), 1)
+        self.assertNotIn(SELECTIZE_JS, html)
+        html = self.render('{% bootstrap_field form.size %}{% bootstrap_media %}', form=SelectForm())
+        self.assertIn(SELECTIZE_JS, html)
+        self.assertNotIn(DATEPICKER_JS, html)
+
+    def test_deduplicated(self):
+        html = self.render('{% for form in forms %}{% bootstrap_form form %}{% endfor %}{% bootstrap_media %}',
+                           forms=[DateForm(), SelectForm(), DateForm(prefix='other')])
+        self.assertEqual(html.count(DATEPICKER_JS), 1)
+        self.assertEqual(html.count(DATEPICKER_CSS), 1)
+        self.assertEqual(html.count(SELECTIZE_JS), 1)
+
+    def test_defer(self):
+        html = self.render('{% bootstrap_form form %}{% bootstrap_media defer=False %}', form=DateForm())
+        self.assertIn('<script src="/static/datepicker/js/bootstrap-datepicker.min.js"></script>', html)
+        self.assertNotIn('defer', html)
+
+    def test_reset(self):
+        html = self.render('{% bootstrap_form form %}{% bootstrap_media %}|{% bootstrap_media %}', form=DateForm())
+        first, second = html.split('|')
+        self.assertIn(DATEPICKER_JS, first)
+        self.assertEqual(second, '')
+
+    def test_extra(self):
+        html = self.render('{% bootstrap_media form %}', request=False, form=SelectForm())
+        self.assertIn(SELECTIZE_JS, html)
+        self.assertIn(DATEPICKER_JS, html)
+
+    def test_without_request(self):
+        self.assertNotIn('<script', self.render('{% bootstrap_form form %}{% bootstrap_media %}', request=False,
+                                                form=DateForm()))
+
+    def test_plain_form(self):
+        html = self.render('{% bootstrap_form form %}{% bootstrap_media %}', form=PlainForm())
+        self.assertNotIn('<script', html)
+        self.assertNotIn('<link', html)
+
+    def test_jquery(self):
+        html = self.render('{% bootstrap_form form %}{% bootstrap_media %}', form=SelectForm())
+        self.assertNotIn('jquery', html)
+        with override_settings(BOOTSTRAP_MEDIA_JQUERY=True):
+            html = self.render('{% bootstrap_form form %}{% bootstrap_media %}', form=SelectForm())
+        self.assertEqual(html.count(JQUERY_JS), 1)
+        self.assertLess(html.index(JQUERY_JS), html.index(SELECTIZE_JS))
+        self.assertLess(html.index(JQUERY_JS), html.index(DATEPICKER_JS))
+
+    def test_subclass_media(self):
+        class CalendarInput (widgets.DateInput):
+            class Media:
+                js = ('calendar.js',)
+
+        self.assertEqual(CalendarInput().media._js, ['datepicker/js/bootstrap-datepicker.min.js', 'calendar.js'])
@@ -0,0 +1,99 @@
+from django import forms
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from bootstrap import widgets
+from bootstrap.schema import form_definition, form_schema, form_state
+from bootstrap.templatetags.bootstrap import bootstrap_form
+
+from .forms import COLORS, ExampleForm
+
+from unittest import mock
+import json
+import os
+import re
+import shutil
+import subprocess
+import unittest
+
+RENDERER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        'bootstrap', 'static', 'bootstrap-forms', 'js', 'bootstrap-forms.js')
+
+
+class SchemaForm (ExampleForm):
+    size = forms.ChoiceField(widget=widgets.Select, choices=[('', '---'), ('s', 'S & M')])
+    count = forms.IntegerField(widget=widgets.NumberInput)
+    shade = forms.ChoiceField(widget=widgets.RadioSelect(attrs={'id': 'shade-choice'}), choices=COLORS)
+    shapes = forms.MultipleChoiceField(widget=widgets.CheckboxSelectMultiple(attrs={'id': 'shape-choices'}),
+                                       choices=[('o', 'Circle'), ('x', 'Cross')], required=False)
+    when_exactly = forms.SplitDateTimeField(required=False)
+    attachment = forms.FileField(required=False)
+    ids = forms.MultipleChoiceField(widget=forms.MultipleHiddenInput, choices=[('1', '1'), ('2', '2')],
+                                    required=False)
+
+    def clean(self):
+        raise forms.ValidationError('Not <allowed>.')
+
+
+def normalize(html):
+    html = re.sub(r'\s+', ' ', re.sub(r'\s+<', '<', re.sub(r'>\s+', '>', html)))
+    # Attribute order differs between the server and client renderers.
+    return re.sub(r'<(\w+)([^<>]*)>', lambda m: '<%s %s>' % (
+        m.group(1), ' '.join(sorted(re.findall(r'[\w-]+(?:="[^"]*"|=\'[^\']*\')?', m.group(2))))), html).strip()
+
+
+class SchemaTests (SimpleTestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def test_html_fields(self):
+        schema = {f['name']: f for f in form_schema(SchemaForm)['fields']}
+        for name in ('when_exactly', 'attachment', 'ids'):
+            self.assertIs(schema[name]['client_renderable'], False)
+            self.assertNotIn('attrs', schema[name]['widget'])
+        self.assertIs(schema['name']['client_renderable'], True)
+        data = {'when_exactly_0': '2020-01-02', 'when_exactly_1': '10:30', 'ids': ['1', '2']}
+        state = form_state(SchemaForm(data))
+        self.assertIn('value="2020-01-02"', state['html']['when_exactly'])
+        self.assertIn('value="10:30"', state['html']['when_exactly'])
+        self.assertEqual(state['html']['ids'].count('type="hidden"'), 2)
+        self.assertNotIn('name', state['html'])
+
+    def test_cache_key(self):
+        schema = form_schema(ExampleForm)
+        with mock.patch('bootstrap.schema.build_form_schema', return_value={'fields': []}) as build:
+            self.assertEqual(form_schema(ExampleForm), schema)
+            self.assertFalse(build.called)
+            with override_settings(BOOTSTRAP_SCHEMA_VERSION='2'):
+                form_schema(ExampleForm)
+            self.assertEqual(build.call_count, 1)
+
+    def test_form_definition(self):
+        definition = form_definition(ExampleForm)
+        self.assertEqual(form_definition(ExampleForm), definition)
+
+        class ChangedForm (ExampleForm):
+            pass
+
+        ChangedForm.base_fields['name'].help_text = 'Changed'
+        self.assertNotEqual(form_definition(ChangedForm), definition)
+
+    @unittest.skipUnless(shutil.which('node'), 'node is not installed')
+    def test_client_renderer(self):
+        script = ('var fs = require("fs"); eval(fs.readFileSync(%s, "utf8"));'
+                  'var d = JSON.parse(fs.readFileSync(0, "utf8"));'
+                  'process.stdout.write(BootstrapForms.renderForm(d[0], d[1]));' % json.dumps(RENDERER))
+        datasets = [
+            None,
+            {'name': 'x"y', 'color': 'green', 'sizes': ['s', 'l'], 'agree': 'on', 'size': 's', 'count': 'zz',
+             'shade': 'blue', 'shapes': ['x'],
+             'when_exactly_0': '2020-01-02', 'when_exactly_1': 'xx', 'ids': ['1']},
+            {'color': 'purple', 'sizes': ['x'], 'size': 'q', 'shade': 'pink', 'shapes': ['z']},
+        ]
+        for data in datasets:
+            form = SchemaForm(data)
+            payload = json.dumps([form_schema(SchemaForm), form_state(form)])
+            result = subprocess.run(['node', '-e', script], input=payload, stdout=subprocess.PIPE,
+                                    stderr=subprocess.PIPE, universal_newlines=True, check=True)
+            self.assertEqual(normalize(result.stdout), normalize(bootstrap_form(form)))
@@ -0,0 +1,58 @@
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+
+from bootstrap.templatetags.bootstrap import bootstrap_field, bootstrap_form
+
+from . import stress
+from .forms import ExampleForm
+from .utils import create_request
+
+
+class RenderStateTests (SimpleTestCase):
+
+    def test_repeated_renders(self):
+        form = ExampleForm({'name': ''})
+        attrs = dict(form.fields['name'].widget.attrs)
+        html = bootstrap_form(form)
+        self.assertEqual(bootstrap_form(form), html)
+        self.assertEqual(html.count('is-invalid'), bootstrap_form(form).count('is-invalid'))
+        self.assertEqual(form.fields['name'].widget.attrs, attrs)
+
+    def test_attrs_changed_after_render(self):
+        form = ExampleForm()
+        bootstrap_field(form['name'])
+        form.fields['name'].widget.attrs['placeholder'] = 'Name'
+        self.assertIn('placeholder="Name"', bootstrap_field(form['name']))
+        self.assertNotIn('aria-labelledby', form.fields['name'].widget.attrs)
+
+    def test_override_template(self):
+        # Project templates on the lookup list render {{ field }} and iterate over it, like field.html used to.
+        templates = {
+            'bootstrap/exampleform_name.html': '{{ field }}',
+            'bootstrap/exampleform_color.html': '{% for choice in field %}{{ choice.tag }}{% endfor %}',
+        }
+        settings = [{
+            'BACKEND': 'django.template.backends.django.DjangoTemplates',
+            'OPTIONS': {
+                'loaders': [
+                    ('django.template.loaders.locmem.Loader', templates),
+                    'django.template.loaders.app_directories.Loader',
+                ],
+            },
+        }]
+        form = ExampleForm({'name': '', 'color': 'purple'})
+        with override_settings(TEMPLATES=settings):
+            name = bootstrap_field(form['name'])
+            color = bootstrap_field(form['color'])
+        self.assertIn('aria-labelledby="id_name-label"', name)
+        self.assertIn('aria-describedby="id_name-help id_name-errors"', name)
+        self.assertIn('is-invalid', name)
+        self.assertEqual(color.count('is-invalid'), 3)
+        self.assertEqual(color.count('aria-describedby="id_color-label id_color-errors"'), 3)
+        self.assertNotIn('aria-labelledby', form.fields['name'].widget.attrs)
+
+
+class ThreadingTests (TransactionTestCase):
+
+    def test_concurrent_renders_match_baseline(self):
+        for threads, _rate, mismatches in stress.run(create_request(), threads=(2, 4), count=120):
+            self.assertEqual(mismatches, 0, '%s threads' % threads)
@@ -0,0 +1,8 @@
+from django.urls import path
+
+from . import views
+
+urlpatterns = [
+    path('requests/<int:pk>/', views.request_detail, name='request-detail'),
+    path('async/requests/<int:pk>/', views.arequest_detail, name='arequest-detail'),
+]
@@ -0,0 +1,40 @@
+import contextlib
+import datetime
+import os
+
+
+def setup():
+    """
+    Configures Django with ``tests.settings``, for running the benchmarks in this package as scripts.
+    """
+    import django
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tests.settings')
+    django.setup()
+
+
+@contextlib.contextmanager
+def test_database():
+    """
+    Creates (and afterwards destroys) the test database, for running the benchmarks in this package as scripts.
+    """
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def create_request(categories=5):
+    """
+    Creates and returns a ``Request`` with a category and some tags, along with ``categories`` categories.
+    """
+    from .models import Category, Request
+    cats = [Category.objects.create(name='Category %d' % i) for i in range(categories)]
+    req = Request.objects.create(name='Jane Doe', email='jane@example.com', category=cats[0],
+                                 submitted=datetime.date(2020, 1, 2), urgent=True)
+    req.tags.set(cats[1:3])
+    return req
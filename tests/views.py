@@ -0,0 +1,35 @@
+from asgiref.sync import sync_to_async
+from django.shortcuts import get_object_or_404, render
+
+from bootstrap import aio
+
+from .forms import ExampleForm, RequestForm
+from .models import Request
+
+VALUE_FIELDS = ('name', 'email', 'category', 'tags', 'submitted', 'urgent')
+
+
+def _load(pk):
+    req = get_object_or_404(Request, pk=pk)
+    return req, RequestForm(instance=req), ExampleForm()
+
+
+def request_detail(request, pk):
+    req, form, search = _load(pk)
+    return render(request, 'tests/request_detail.html', {
+        'req': req,
+        'form': form,
+        'search': search,
+        'fields': VALUE_FIELDS,
+    })
+
+
+async def arequest_detail(request, pk):
+    req, form, search = await sync_to_async(_load)(pk)
+    form_html, search_html = await aio.abootstrap_forms([form, search])
+    values = await aio.arender_values(req, VALUE_FIELDS)
+    return await sync_to_async(render)(request, 'tests/request_detail_async.html', {
+        'form_html': form_html,
+        'search_html': search_html,
+        'values': values,
+    })